@@ -8,7 +8,7 @@
 __version__ = "0.2"
 import argparse
 import os
-import ntpath
+import shutil
 from PyOpenColorIO import Constants
 from utils import debug_helper
 import sys
@@ -16,6 +16,7 @@ import utils.lut_presets as presets
 from utils.lut_utils import get_default_out_path, check_extension
 from utils.ocio_helper import (create_ocio_processor,
                                is_3d_lut)
+from utils.cube_helper import CUBE_1D, CUBE_3D, CUBE_HELPER
 from utils.export_tool_helper import (add_export_lut_options,
                                       add_version_option,
                                       add_inverse_option,
@@ -38,6 +39,88 @@ class LutToLutException(Exception):
     pass
 
 
+# bytes read to guess a LUT dimension from its header
+PEEK_SIZE = 4096
+
+
+def __peek_lut_dim(lutfile):
+    """ Guess LUT dimension from its extension and header, without
+    creating an OpenColorIO processor
+
+    Args:
+        lutfile (str): path to a LUT
+
+    Returns:
+        .int (1 or 3) or None if dimension couldn't be guessed
+
+    """
+    fileext = os.path.splitext(lutfile)[1].lower()
+    if fileext in ['.3dl', '.spi3d', '.spimtx']:
+        return 3
+    if fileext == '.spi1d':
+        return 1
+    if fileext not in ['.csp', '.cube']:
+        return None
+    try:
+        with open(lutfile) as afile:
+            header = afile.read(PEEK_SIZE)
+    except (IOError, UnicodeDecodeError):
+        return None
+    if fileext == '.csp':
+        # CSPLUTV100 then 1D or 3D
+        lines = header.splitlines()
+        if len(lines) > 1 and lines[1].strip() in ['1D', '3D']:
+            return int(lines[1].strip()[0])
+    elif CUBE_3D in header:
+        return 3
+    elif CUBE_1D in header:
+        return 1
+    return None
+
+
+def __is_identity_conversion(inlutfile, preset):
+    """ Check if converting inlutfile with preset would resample it on its
+    own grid, in the same format and ranges. Only cube LUTs are checked.
+
+    Args:
+        inlutfile (str): path to a LUT
+
+        preset (dict): lut generic and sampling informations
+
+    Returns:
+        .bool
+
+    """
+    if (preset[presets.EXT] != '.cube'
+            or os.path.splitext(inlutfile)[1].lower() != '.cube'):
+        return False
+    for arange in [preset[presets.IN_RANGE], preset[presets.OUT_RANGE]]:
+        if presets.is_int(arange) or list(arange) != [0.0, 1.0]:
+            return False
+    if preset[presets.TYPE] == '3D':
+        expected = "{0} {1}".format(CUBE_3D, preset[presets.CUBE_SIZE])
+    else:
+        # 1D cube LUTs are written as 2D
+        expected = "{0} {1}".format(CUBE_1D,
+                                    pow(2, preset[presets.OUT_BITDEPTH]))
+    try:
+        with open(inlutfile) as afile:
+            header = afile.read(PEEK_SIZE)
+    except (IOError, UnicodeDecodeError):
+        return False
+    # keywords other than title (size, domain...) before first data line
+    keywords = []
+    for line in header.splitlines():
+        words = line.split()
+        if not words or words[0].startswith('#'):
+            continue
+        if not words[0][0].isalpha():
+            return keywords == [expected]
+        if words[0] != 'TITLE':
+            keywords.append(" ".join(words))
+    return False
+
+
 def lut_to_lut(inlutfiles, out_type=None, out_format=None, outlutfile=None,
                input_range=None, output_range=None, out_bit_depth=None,
                inverse=False, out_cube_size=None, verbose=False,
@@ -103,7 +186,7 @@ def lut_to_lut(inlutfiles, out_type=None, out_format=None, outlutfile=None,
     if not outlutfile:
         outlutfile = get_default_out_path(inlutfiles, ext)
     elif os.path.isdir(outlutfile):
-        filename = os.path.splitext(ntpath.basename(inlutfiles[0]))[0] + ext
+        filename = os.path.splitext(os.path.basename(inlutfiles[0]))[0] + ext
         outlutfile = os.path.join(outlutfile, filename)
     else:
         check_extension(outlutfile, ext)
@@ -114,13 +197,35 @@ def lut_to_lut(inlutfiles, out_type=None, out_format=None, outlutfile=None,
         print("{0} will be converted into {1}.".format(inlutfiles,
                                                        outlutfile))
         print("Final setting:\n{0}".format(presets.string_preset(preset)))
-    processor = create_ocio_processor(inlutfiles,
-                                      interpolation=Constants.INTERP_LINEAR,
-                                      inverse=inverse)
-    # change interpolation if 3D LUT
-    if is_3d_lut(processor, inlutfiles[0]):
+    # same LUT in same format: no need to resample it
+    if (len(inlutfiles) == 1 and not inverse
+            and not preset.get(presets.SMOOTH)
+            and __is_identity_conversion(inlutfiles[0], preset)):
+        try:
+            shutil.copyfile(inlutfiles[0], outlutfile)
+        except shutil.SameFileError:
+            pass
+        if verbose:
+            print("Same format, size and ranges: input LUT is copied.")
+            print_success_message(CUBE_HELPER.get_export_message(outlutfile))
+        return
+    dimensions = [__peek_lut_dim(lutfile) for lutfile in inlutfiles]
+    if None in dimensions:
+        # unknown dimension: probe a processor to detect a 3D LUT
+        processor = create_ocio_processor(inlutfiles,
+                                          interpolation=Constants.INTERP_LINEAR,
+                                          inverse=inverse)
+        # change interpolation if 3D LUT
+        if is_3d_lut(processor, inlutfiles[0]):
+            processor = create_ocio_processor(inlutfiles,
+                                              interpolation=Constants.INTERP_TETRAHEDRAL,
+                                              inverse=inverse)
+    else:
+        interpolation = Constants.INTERP_LINEAR
+        if 3 in dimensions:
+            interpolation = Constants.INTERP_TETRAHEDRAL
         processor = create_ocio_processor(inlutfiles,
-                                          interpolation=Constants.INTERP_TETRAHEDRAL,
+                                          interpolation=interpolation,
                                           inverse=inverse)
     # write LUT
     message = write_function(processor.applyRGB, outlutfile, preset)
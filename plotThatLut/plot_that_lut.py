@@ -13,11 +13,9 @@ from utils.ocio_helper import (
     OCIO_LUTS_FORMATS, create_ocio_processor, is_3d_lut
 )
 from utils.lut_utils import get_3d_list_values
-# matplotlib
-import matplotlib
 import itertools
+import numpy
 from utils import matplotlib_helper as mplh
-import ntpath
 
 
 class PlotThatLutException(Exception):
@@ -32,6 +30,24 @@ class PlotThatLutException(Exception):
 
 DEFAULT_SAMPLE = 256
 DEFAULT_CUBE_SIZE = 17
+# max number of points displayed by a cube plot
+DEFAULT_MAX_POINTS = 8192
+# matplotlib.pyplot, imported once the backend is set
+pyplot = None
+
+
+def __init_matplotlib():
+    """Set matplotlib backend and import pyplot and mplot3d (only once)
+
+    """
+    global pyplot
+    if pyplot is not None:
+        return
+    mplh.set_matplotlib_backend()
+    import matplotlib.pyplot
+    # mplot3d has to be imported for 3d projection
+    import mpl_toolkits.mplot3d
+    pyplot = matplotlib.pyplot
 
 
 def show_plot(fig, filename):
@@ -59,10 +75,13 @@ def show_plot(fig, filename):
         abs_export_path = '{0}/img/export_{1}.png'.format(current_dir,
                                                           filename)
         print(abs_export_path)
-        fig.savefig(abs_export_path)
+        # fast png compression: plots are generated per request
+        fig.savefig(abs_export_path, pil_kwargs={'compress_level': 1})
+        # release figure, web server is long-running
+        pyplot.close(fig)
         return export_path
     else:
-        matplotlib.pyplot.show()
+        pyplot.show()
         return ""
 
 
@@ -91,74 +110,66 @@ def plot_curve(lutfiles, samples_count, processors, draw_red_curve=True,
             str.
 
     """
-    # matplotlib : general plot
-    from matplotlib.pyplot import (title, plot, xlabel, ylabel, grid,
-                                   figure)
-
+    __init_matplotlib()
     # init plot
-    fig = figure()
+    fig = pyplot.figure()
     fig.canvas.set_window_title('Plot That 1D LUT')
     figure_title = ""
     for lutfile in lutfiles:
         filename = os.path.basename(lutfile)
         figure_title = "{0}\n{1}".format(figure_title, filename)
-    title(figure_title)
-    xlabel("Input")
-    ylabel("Output")
-    grid(True)
+    pyplot.title(figure_title)
+    pyplot.xlabel("Input")
+    pyplot.ylabel("Output")
+    pyplot.grid(True)
     markers_it = itertools.cycle(mplh.MARKERS)
     reds_it = itertools.cycle(mplh.REDS)
     greens_it = itertools.cycle(mplh.GREENS)
     blues_it = itertools.cycle(mplh.BLUES)
+    input_range = numpy.arange(samples_count) / (samples_count - 1.0)
     for lutfile, processor in zip(lutfiles, processors):
-        # init vars
-        max_value = samples_count - 1.0
-        red_values = []
-        green_values = []
-        blue_values = []
-        input_range = []
-        # process color values
-        for code_value in range(0, samples_count):
-            norm_value = code_value / max_value
-            res = processor.applyRGB([norm_value, norm_value, norm_value])
-            red_values.append(res[0])
-            green_values.append(res[1])
-            blue_values.append(res[2])
-            input_range.append(norm_value)
+        # process color values in a single call
+        res = processor.applyRGB(numpy.repeat(input_range, 3).tolist())
+        res = numpy.array(res).reshape(-1, 3)
+        red_values = res[:, 0]
+        green_values = res[:, 1]
+        blue_values = res[:, 2]
         # markers
         marker = next(markers_it)
         markersize = 0
         if display_markers:
             markersize = 4
         # plot curves
-        labelbase = os.path.splitext(ntpath.basename(lutfile))[0]
+        labelbase = os.path.splitext(os.path.basename(lutfile))[0]
         if draw_red_curve:
             if not draw_blue_curve and not draw_green_curve:
                 label = labelbase
             else:
                 label = "{0} (R)".format(labelbase)
-            plot(input_range, red_values, color=next(reds_it), marker=marker,
-                 label=label, linewidth=1, markersize=markersize)
+            pyplot.plot(input_range, red_values, color=next(reds_it),
+                        marker=marker, label=label, linewidth=1,
+                        markersize=markersize)
         if draw_green_curve:
             if not draw_blue_curve and not draw_red_curve:
                 label = labelbase
             else:
                 label = "{0} (G)".format(labelbase)
-            plot(input_range, green_values, color=next(greens_it),
-                 marker=marker, label=label, linewidth=1,
-                 markersize=markersize)
+            pyplot.plot(input_range, green_values, color=next(greens_it),
+                        marker=marker, label=label, linewidth=1,
+                        markersize=markersize)
         if draw_blue_curve:
             if not draw_green_curve and not draw_red_curve:
                 label = labelbase
             else:
                 label = "{0} (B)".format(labelbase)
-            plot(input_range, blue_values, color=next(blues_it), marker=marker,
-                 label=label, linewidth=1, markersize=markersize)
-    matplotlib.pyplot.legend(loc=4)
+            pyplot.plot(input_range, blue_values, color=next(blues_it),
+                        marker=marker, label=label, linewidth=1,
+                        markersize=markersize)
+    pyplot.legend(loc=4)
     return show_plot(fig, filename)
 
 
-def plot_cube(lutfile, cube_size, processor):
+def plot_cube(lutfile, cube_size, processor, max_points=DEFAULT_MAX_POINTS):
     """Plot a lutfile as a cube
 
     Args:
@@ -170,35 +181,43 @@ def plot_cube(lutfile, cube_size, processor):
         processor (PyOpenColorIO.config.Processor): an OpenColorIO processor
         for lutfile
 
+    Kwargs:
+        max_points (int): if the cube has more points, a uniform random
+        subset of max_points points is displayed
+
     Returns:
         str.
 
     """
-    # matplotlib : general plot
-    from matplotlib.pyplot import title, figure
-    # matplotlib : for 3D plot
-    # mplot3d has to be imported for 3d projection
-    import mpl_toolkits.mplot3d
+    __init_matplotlib()
     # init vars
-    processed_values = get_3d_list_values(cube_size, processor,
-                                          hexa_values=True)
+    processed_values = get_3d_list_values(cube_size, processor)
     red_values = processed_values['red_values']
     green_values = processed_values['green_values']
     blue_values = processed_values['blue_values']
     input_colors = processed_values['input_colors']
     # init plot
-    fig = figure()
+    fig = pyplot.figure()
     fig.canvas.set_window_title('Plot That 3D LUT')
     axis = fig.add_subplot(111, projection='3d')
     axis.set_xlabel('Red')
     axis.set_ylabel('Green')
     axis.set_zlabel('Blue')
-    axis.set_xlim(min(red_values), max(red_values))
-    axis.set_ylim(min(green_values), max(green_values))
-    axis.set_zlim(min(blue_values), max(blue_values))
+    axis.set_xlim(red_values.min(), red_values.max())
+    axis.set_ylim(green_values.min(), green_values.max())
+    axis.set_zlim(blue_values.min(), blue_values.max())
     filename = os.path.basename(lutfile)
-    title(filename)
-    # plot 3D values
+    pyplot.title(filename)
+    # subsample displayed points (limits are kept on the whole cube)
+    if len(input_colors) > max_points:
+        indexes = numpy.random.default_rng(0).choice(len(input_colors),
+                                                     max_points,
+                                                     replace=False)
+        red_values = red_values[indexes]
+        green_values = green_values[indexes]
+        blue_values = blue_values[indexes]
+        input_colors = input_colors[indexes]
+    # plot 3D values (input colors are float RGB triplets)
     axis.scatter(red_values, green_values, blue_values, c=input_colors,
                  marker="o")
     return show_plot(fig, filename)
@@ -239,7 +258,7 @@ def plot_that_lut(lutfiles, plot_type=None, count=None, inverse=False,
     """
     if not isinstance(lutfiles, list):
         lutfiles = [lutfiles]
-    mplh.set_matplotlib_backend()
+    __init_matplotlib()
     processors = []
     for lutfile in lutfiles:
         # check if LUT format is supported
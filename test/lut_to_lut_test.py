@@ -3,6 +3,7 @@
 """
 import unittest
 import shutil
+import filecmp
 import os
 import tempfile
 from lutLab.lut_to_lut import lut_to_lut
@@ -120,6 +121,19 @@ class LUTToLUTTest(unittest.TestCase):
                    "3D", "csp", outlutfile)
         lut_to_lut(outlutfile, "2D", "lut", self.tmp_dir)
 
+    def test_identity_conversion(self):
+        """ Test same format/size/ranges conversion (input is copied)
+
+        """
+        cubefile = os.path.join(self.tmp_dir, "saturation_export.cube")
+        lut_to_lut(self.lut3d, "3D", "cube", cubefile)
+        outlutfile = os.path.join(self.tmp_dir, "saturation_copy.cube")
+        lut_to_lut(cubefile, "3D", "cube", outlutfile)
+        self.assertTrue(filecmp.cmp(cubefile, outlutfile, shallow=False))
+        # different cube size: LUT is resampled
+        lut_to_lut(cubefile, "3D", "cube", outlutfile, out_cube_size=9)
+        self.assertFalse(filecmp.cmp(cubefile, outlutfile, shallow=False))
+
     def tearDown(self):
         # Remove test directory
         shutil.rmtree(self.tmp_dir)
@@ -5,7 +5,6 @@
 """
 __version__ = "0.3"
 from abc import ABCMeta, abstractmethod
-from collections import namedtuple
 from numpy import linspace
 from utils.lut_utils import get_file_shortname
 from utils import lut_presets as presets
@@ -19,9 +18,6 @@ from scipy.interpolate import PchipInterpolator
 import numpy
 import itertools
 
-# RGB triplet object
-Rgb = namedtuple('Rgb', 'r g b')
-
 
 class AbstractLUTException(Exception):
     """Module custom exception
@@ -78,13 +74,13 @@ class AbstractLUTHelper(object, metaclass=ABCMeta):
         Args:
             preset (dict): lut generic and sampling informations
 
-            rgb (Rgb): values
+            rgb ([r, g, b]): values
 
         Returns:
             .str
 
         """
-        return self._get_pattern_1d(preset).format(rgb.r)
+        return self._get_pattern_1d(preset).format(rgb[0])
 
     def _get_rgb_value_line(self, preset, rgb, in_rgb=None, separator=" "):
         """ Get string pattern for a 2D / 3D LUT
@@ -92,7 +88,7 @@ class AbstractLUTHelper(object, metaclass=ABCMeta):
         Args:
             preset (dict): lut generic and sampling informations
 
-            rgb (Rgb): values
+            rgb ([r, g, b]): values
 
         Kwargs:
             in_rgb: input triplets, required by some LUT formats
@@ -104,15 +100,33 @@ class AbstractLUTHelper(object, metaclass=ABCMeta):
             .str
 
         """
-        line = self._get_pattern(preset, separator).format(rgb.r, rgb.g, rgb.b)
+        line = self._get_pattern(preset, separator).format(*rgb)
         if in_rgb is not None:
-            return "{0}{4}{1}{4}{2}{4}{3}".format(in_rgb.r,
-                                                  in_rgb.g,
-                                                  in_rgb.b,
+            return "{0}{4}{1}{4}{2}{4}{3}".format(in_rgb[0],
+                                                  in_rgb[1],
+                                                  in_rgb[2],
                                                   line,
                                                   separator)
         return line
 
+    def _get_line_pattern(self, preset, line_function):
+        """ Get the string pattern used by line_function, so that lines can be
+        formatted without calling line_function for each value
+
+        Args:
+            preset (dict): lut generic and sampling informations
+
+            line_function (function): _get_rgb_value_line or
+            _get_r_value_line
+
+        Returns:
+            .str (to be formatted with r, g, b values)
+
+        """
+        if line_function == self._get_r_value_line:
+            return self._get_pattern_1d(preset)
+        return self._get_pattern(preset)
+
     def _get_1d_data(self, process_function, preset):
         """ Process 1D/2D data considering LUT params
 
@@ -125,7 +139,7 @@ class AbstractLUTHelper(object, metaclass=ABCMeta):
             preset (dict): lut generic and sampling informations
 
         Returns:
-            .[Rgb]
+            .numpy.array (samples count x 3)
 
         """
         self.check_preset(preset)
@@ -145,66 +159,40 @@ class AbstractLUTHelper(object, metaclass=ABCMeta):
         compute_range = linspace(input_range[0],
                                  input_range[1],
                                  samples_count)
-        data = []
-        for code_value in compute_range:
-            norm_value = code_value
-            if is_int:
-                norm_value = (code_value - input_range[0]) / input_range[1]
-            res = process_function([norm_value, norm_value, norm_value])
-            res = [(x * output_range[1]) + output_range[0] for x in res]
-            if is_int:
-                res = [int(x) for x in res]
-            data.append(Rgb(res[0], res[1], res[2]))
+        if is_int:
+            compute_range = (compute_range - input_range[0]) / input_range[1]
+        # process every sample in a single call
+        res = process_function(numpy.repeat(compute_range, 3).tolist())
+        res = numpy.array(res).reshape(-1, 3)
+        res = (res * output_range[1]) + output_range[0]
+        if is_int:
+            res = res.astype(int)
         if smooth_size:
-            data = self.__smooth_1d_data(data, preset)
-        return data
+            return self.__smooth_1d_data(res, preset)
+        return res
 
     def __smooth_1d_data(self, data, preset):
         """ Smooth data (1D / 2D only)
 
         Args:
-            data ([Rgb]): processed with _get_1d_data
+            data (numpy.array): processed with _get_1d_data
 
             preset (dict): lut generic and sampling informations
 
         Returns:
-            .[Rgb]
+            .numpy.array (samples count x 3)
 
         """
         samples_count = pow(2, preset[presets.OUT_BITDEPTH])
         smooth_count = preset['smooth']
-
-        # remap processed values
-        red_values = []
-        green_values = []
-        blue_values = []
-        for rgb in data:
-            red_values.append(rgb.r)
-            green_values.append(rgb.g)
-            blue_values.append(rgb.b)
         # get full range
         old_range = numpy.arange(0, smooth_count)
         new_range = numpy.arange(0, smooth_count - 1,
                                  float(smooth_count - 1) / samples_count)
-        # get a monotonic cubic function from subsampled curve
-        red_cubic_monotonic_func = PchipInterpolator(old_range,
-                                                     red_values)
-        green_cubic_monotonic_func = PchipInterpolator(old_range,
-                                                       green_values)
-        blue_cubic_monotonic_func = PchipInterpolator(old_range,
-                                                      blue_values)
+        # get a monotonic cubic function per channel from subsampled curve
+        cubic_monotonic_func = PchipInterpolator(old_range, data)
         # get new values
-        sampled_reds = red_cubic_monotonic_func(new_range)
-        sampled_greens = green_cubic_monotonic_func(new_range)
-        sampled_blues = blue_cubic_monotonic_func(new_range)
-
-        # remap processed values in data
-        data = []
-        for red, green, blue in zip(sampled_reds,
-                                               sampled_greens,
-                                               sampled_blues):
-            data.append(Rgb(red, green, blue))
-        return data
+        return cubic_monotonic_func(new_range)
 
     def _get_3d_data(self, process_function, preset,
                      inverse_loops_order=False):
@@ -228,7 +216,8 @@ class AbstractLUTHelper(object, metaclass=ABCMeta):
                     for red in blues:
 
         Returns:
-            .[input Rgb], [output Rgb]
+            .numpy.array (cube size^3 x 3) of input indexes,
+            numpy.array (cube size^3 x 3) of output values
 
         """
         self.check_preset(preset)
@@ -245,38 +234,34 @@ class AbstractLUTHelper(object, metaclass=ABCMeta):
         compute_range = linspace(input_range[0],
                                  input_range[1],
                                  cube_size)
-        data = []
-        in_data = []
-        b_index = 0
-        for first in compute_range:
-            g_index = 0
-            for green in compute_range:
-                r_index = 0
-                for last in compute_range:
-                    if inverse_loops_order:
-                        blue = last
-                        red = first
-                    else:
-                        blue = first
-                        red = last
-                    norm_red = red
-                    norm_green = green
-                    norm_blue = blue
-                    if is_int:
-                        norm_red = (red - input_range[0]) / input_range[1]
-                        norm_green = (green - input_range[0]) / input_range[1]
-                        norm_blue = (blue - input_range[0]) / input_range[1]
-                    res = process_function([norm_red, norm_green, norm_blue])
-                    res = [(x * output_range[1]) + output_range[0]
-                           for x in res]
-                    if is_int:
-                        res = [int(x) for x in res]
-                    in_data.append(Rgb(r_index, g_index, b_index))
-                    data.append(Rgb(res[0], res[1], res[2]))
-                    r_index += 1
-                g_index += 1
-            b_index += 1
-        return in_data, data
+        if is_int:
+            compute_range = (compute_range - input_range[0]) / input_range[1]
+        samples = self._get_cube_grid(compute_range)
+        if inverse_loops_order:
+            samples = samples[:, ::-1]
+        # process the whole cube in a single call
+        res = process_function(samples.ravel().tolist())
+        res = numpy.array(res).reshape(-1, 3)
+        res = (res * output_range[1]) + output_range[0]
+        if is_int:
+            res = res.astype(int)
+        return self._get_cube_grid(numpy.arange(cube_size)), res
+
+    @staticmethod
+    def _get_cube_grid(values):
+        """ Get every triplet of a cube sampled by values, first component
+        varying first, then second, then third
+
+        Args:
+            values (numpy.array): samples of a cube axis
+
+        Returns:
+            .numpy.array (len(values)^3 x 3)
+
+        """
+        thirds, seconds, firsts = numpy.meshgrid(values, values, values,
+                                                 indexing='ij')
+        return numpy.stack([firsts, seconds, thirds], axis=-1).reshape(-1, 3)
 
     @abstractmethod
     def _write_1d_2d_lut(self, process_function, file_path, preset,
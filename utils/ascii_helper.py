@@ -111,36 +111,33 @@ class AsciiLutHelper(AbstractLUTHelper):
         # data
         if preset[presets.LAYOUT] == presets.BLOCK_LAYOUT:
             # line_function mustn't be used here
-            for rgb in data:
-                lutfile.write(self._get_pattern_1d(preset).format(rgb.r))
+            pattern = self._get_pattern_1d(preset)
             if preset[presets.TYPE] == '2D':
-                for rgb in data:
-                    lutfile.write(self._get_pattern_1d(preset).format(rgb.g))
-                for rgb in data:
-                    lutfile.write(self._get_pattern_1d(preset).format(rgb.b))
+                # red block, then green block, then blue block
+                values = data.T.ravel()
+            else:
+                values = data[:, 0]
+            lutfile.write("".join(pattern.format(value)
+                                  for value in values.tolist()))
         elif preset[presets.LAYOUT] == presets.TRIPLET_LAYOUT:
-            index = 0
-            for rgb in data:
-                line = line_function(preset, rgb,
-                                     separator=preset[presets.SEPARATOR])
+            separator = preset[presets.SEPARATOR]
+            write_alpha = preset[presets.WRITE_ALPHA]
+            write_index = preset[presets.WRITE_INDEX]
+            if preset[presets.IS_FLOAT]:
+                alpha = '0.0'
+            else:
+                alpha = '0'
+            lines = []
+            for index, rgb in enumerate(data.tolist()):
+                line = line_function(preset, rgb, separator=separator)
                 # add alpha value if necessary
-                if preset[presets.WRITE_ALPHA]:
-                    line = line.strip()
-                    if preset[presets.IS_FLOAT]:
-                        alpha = '0.0'
-                    else:
-                        alpha = '0'
-                    line = "{0}{1}{2}\n".format(line,
-                                                preset[presets.SEPARATOR],
-                                                alpha)
-
+                if write_alpha:
+                    line = "{0}{1}{2}\n".format(line.strip(), separator, alpha)
                 # add index value if necessary
-                if preset[presets.WRITE_INDEX]:
-                    line = "{0}{1}{2}".format(index,
-                                              preset[presets.SEPARATOR],
-                                              line)
-                lutfile.write(line)
-                index += 1
+                if write_index:
+                    line = "{0}{1}{2}".format(index, separator, line)
+                lines.append(line)
+            lutfile.write("".join(lines))
         lutfile.close()
         return self.get_export_message(file_path)
 
@@ -90,8 +90,8 @@ class CLCCHelper(AbstractLUTHelper):
         lutfile = open(file_path, 'w+')
         lutfile.write(self.get_header(preset))
         # data
-        for rgb in data:
-            lutfile.write(self._get_rgb_value_line(preset, rgb))
+        pattern = self._get_pattern(preset)
+        lutfile.write("".join(pattern.format(*rgb) for rgb in data.tolist()))
         lutfile.close()
         return self.get_export_message(file_path)
 
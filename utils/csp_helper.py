@@ -71,8 +71,8 @@ class CSPLutHelper(AbstractLUTHelper):
         lutfile = open(file_path, 'w+')
         lutfile.write(header_function(preset))
         # data
-        for rgb in data:
-            lutfile.write(line_function(preset, rgb))
+        pattern = self._get_line_pattern(preset, line_function)
+        lutfile.write("".join(pattern.format(*rgb) for rgb in data.tolist()))
         lutfile.close()
         return self.get_export_message(file_path)
 
@@ -4,6 +4,7 @@
 
 """
 __version__ = "0.3"
+import numpy
 from utils.abstract_lut_helper import AbstractLUTHelper
 from utils.color_log_helper import print_warning_message
 from utils import lut_presets as presets
@@ -20,6 +21,8 @@ class CubeHelperException(Exception):
 
 CUBE_1D = "LUT_1D_SIZE"
 CUBE_3D = "LUT_3D_SIZE"
+# output file buffer size (bytes)
+BUFFER_SIZE = 1 << 20
 
 
 class CubeLutHelper(AbstractLUTHelper):
@@ -48,7 +51,7 @@ class CubeLutHelper(AbstractLUTHelper):
         # Get data
         data = self._get_1d_data(process_function, preset)
         title = preset['title']
-        with open(file_path, 'w+') as lutfile:
+        with open(file_path, 'w', buffering=BUFFER_SIZE) as lutfile:
             # TODO add metadata
             # skip comment because not supported by every soft
             # title
@@ -69,9 +72,8 @@ class CubeLutHelper(AbstractLUTHelper):
 
             # lut size
             lutfile.write("{0} {1}\n\n".format(CUBE_1D, len(data)))
-            # data
-            for rgb in data:
-                lutfile.write(line_function(preset, rgb))
+            # data (cube values are float, 1D LUTs are written as 2D)
+            numpy.savetxt(lutfile, data, fmt="%.6f")
         return self.get_export_message(file_path)
 
     def write_1d_lut(self, process_function, file_path, preset):
@@ -83,7 +85,7 @@ class CubeLutHelper(AbstractLUTHelper):
         data = self._get_3d_data(process_function, preset)[1]
         title = preset['title']
         cube_size = preset['cube_size']
-        with open(file_path, 'w+') as lutfile:
+        with open(file_path, 'w', buffering=BUFFER_SIZE) as lutfile:
             # Test output range
             self._check_output_range(preset)
             # skip comment because not supported by every soft
@@ -93,9 +95,8 @@ class CubeLutHelper(AbstractLUTHelper):
             lutfile.write("TITLE {0}\n\n".format(title))
             # lut size
             lutfile.write("{0} {1}\n\n".format(CUBE_3D, cube_size))
-            # data
-            for rgb in data:
-                lutfile.write(self._get_rgb_value_line(preset, rgb))
+            # data (cube values are float)
+            numpy.savetxt(lutfile, data, fmt="%.6f")
         return self.get_export_message(file_path)
 
     @staticmethod
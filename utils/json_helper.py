@@ -45,27 +45,15 @@ class JsonLutHelper(AbstractLUTHelper):
     def write_3d_lut(self, process_function, file_path, preset):
         in_data, data = self._get_3d_data(process_function, preset)
         cube_size = preset[presets.CUBE_SIZE]
-        input_colors = []
         # get input color values
-        for rgb in in_data:
-            input_colors.append([rgb.r / float(cube_size),
-                                 rgb.g / float(cube_size),
-                                 rgb.b / float(cube_size)])
-        # remap processed values
-        red_values = []
-        green_values = []
-        blue_values = []
-        for rgb in data:
-            red_values.append(rgb.r)
-            green_values.append(rgb.g)
-            blue_values.append(rgb.b)
+        input_colors = in_data / float(cube_size)
         # create json dict
         json_data = {
             'cubesize': cube_size,
-            'red_values': red_values,
-            'green_values': green_values,
-            'blue_values': blue_values,
-            'input_colors': input_colors
+            'red_values': data[:, 0].tolist(),
+            'green_values': data[:, 1].tolist(),
+            'blue_values': data[:, 2].tolist(),
+            'input_colors': input_colors.tolist()
             }
         # write data
         lutfile = open(file_path, 'w+')
@@ -31,7 +31,6 @@ import collections
 from utils.color_log_helper import print_warning_message
 import json
 import os
-import ntpath
 
 
 class PresetException(Exception):
@@ -321,7 +320,7 @@ def _check_and_load_preset(file_path, presets):
         return presets
     if preset is None or not isinstance(preset, dict):
         return presets
-    file_name = os.path.splitext(ntpath.basename(file_path))[0]
+    file_name = os.path.splitext(os.path.basename(file_path))[0]
     presets[file_name] = preset
     return presets
 
@@ -5,8 +5,8 @@
 """
 __version__ = "0.4"
 import os
-import ntpath
 import math
+import numpy
 
 
 class LUTException(Exception):
@@ -58,7 +58,7 @@ def get_default_out_path(filepath, ext):
             if not new_filepath:
                 new_filepath = os.path.splitext(filepath)[0]
             else:
-                basename = os.path.splitext(ntpath.basename(filepath))[0]
+                basename = os.path.splitext(os.path.basename(filepath))[0]
                 new_filepath += "+{0}".format(basename)
     else:
         new_filepath = os.path.splitext(filepath)[0]
@@ -81,42 +81,28 @@ def get_3d_list_values(cubesize, processor, hexa_values=False):
 
     Returns:
         .dict containing cubesize and red, green, blue, input color values
-        as lists
+        as numpy arrays
 
     TODO Use by plot_that_lut, to remove someday
 
     """
-    input_range = list(range(0, cubesize))
-    max_value = cubesize - 1.0
-    red_values = []
-    green_values = []
-    blue_values = []
-    input_colors = []
+    # get values between [0..1], red varying first, then green, then blue
+    norm_values = numpy.arange(cubesize) / (cubesize - 1.0)
+    blues, greens, reds = numpy.meshgrid(norm_values, norm_values,
+                                         norm_values, indexing='ij')
+    input_colors = numpy.stack([reds, greens, blues], axis=-1).reshape(-1, 3)
+    # apply correction via OCIO on the whole cube at once
+    res = processor.applyRGB(input_colors.ravel().tolist())
+    res = numpy.array(res).reshape(-1, 3)
     if hexa_values:
-        from matplotlib.colors import rgb2hex
-    # process color values
-    for blue in input_range:
-        for green in input_range:
-            for red in input_range:
-                # get a value between [0..1]
-                norm_r = red / max_value
-                norm_g = green / max_value
-                norm_b = blue / max_value
-                # apply correction via OCIO
-                res = processor.applyRGB([norm_r, norm_g, norm_b])
-                red_values.append(res[0])
-                green_values.append(res[1])
-                blue_values.append(res[2])
-                # append corresponding input color
-                if hexa_values:
-                    color = rgb2hex([norm_r, norm_g, norm_b])
-                else:
-                    color = [norm_r, norm_g, norm_b]
-                input_colors.append(color)
+        # same rounding as matplotlib.colors.rgb2hex
+        codes = numpy.round(input_colors * 255).astype(int)
+        codes = (codes[:, 0] << 16) | (codes[:, 1] << 8) | codes[:, 2]
+        input_colors = numpy.char.mod('#%06x', codes)
     return {'cubesize': cubesize,
-            'red_values': red_values,
-            'green_values': green_values,
-            'blue_values': blue_values,
+            'red_values': res[:, 0],
+            'green_values': res[:, 1],
+            'blue_values': res[:, 2],
             'input_colors': input_colors
             }
 
@@ -156,7 +142,7 @@ def get_file_shortname(file_path):
     Returns:
         .str
     """
-    return os.path.splitext(ntpath.basename(file_path))[0]
+    return os.path.splitext(os.path.basename(file_path))[0]
 
 
 def get_bitdepth(max_value):
@@ -63,8 +63,8 @@ class SpiLutHelper(AbstractLUTHelper):
         # Components
         lutfile.write("Components 1\n{\n")
         # data
-        for rgb in data:
-            lutfile.write(line_function(preset, rgb))
+        pattern = self._get_line_pattern(preset, line_function)
+        lutfile.write("".join(pattern.format(*rgb) for rgb in data.tolist()))
         lutfile.write("}/n")
         lutfile.close()
         return self.get_export_message(file_path)
@@ -85,8 +85,12 @@ class SpiLutHelper(AbstractLUTHelper):
         # cube size
         lutfile.write("{0} {0} {0}\n".format(preset[presets.CUBE_SIZE]))
         # write data
-        for in_rgb, rgb in zip(in_data, data):
-            lutfile.write(self._get_rgb_value_line(preset, rgb, in_rgb))
+        in_pattern = "{0} {1} {2} "
+        pattern = self._get_pattern(preset)
+        lutfile.write("".join(in_pattern.format(*in_rgb) +
+                              pattern.format(*rgb)
+                              for in_rgb, rgb in zip(in_data.tolist(),
+                                                     data.tolist())))
         lutfile.close()
         return self.get_export_message(file_path)
 
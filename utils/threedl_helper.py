@@ -92,14 +92,14 @@ class ThreedlLutHelper(AbstractLUTHelper):
                                                                in_bit_depth))
             lutfile.write(shaper)
         # data
-        for rgb in data:
-            lutfile.write(self._get_rgb_value_line(preset, rgb))
+        pattern = self._get_pattern(preset)
+        lutfile.write("".join(pattern.format(*rgb) for rgb in data.tolist()))
         lutfile.close()
         return self.get_export_message(file_path)
 
     def _get_rgb_value_line(self, preset, rgb, in_rgb=None, separator=" "):
         # 3dl layout is bgr
-        return self._get_pattern(preset).format(rgb.r, rgb.g, rgb.b)
+        return self._get_pattern(preset).format(*rgb)
 
     @staticmethod
     def _get_range_message(range_name, arange):